@@ -44,6 +44,7 @@ from bs4 import BeautifulSoup
 from open_webui.models.credits import Credits
 from open_webui.utils import logger
 from open_webui.utils.audit import AuditLevel, AuditLoggingMiddleware
+from open_webui.utils.credit.ezfp import ezfp_client
 from open_webui.utils.credit.utils import is_free_request, check_credit_by_user_id
 from open_webui.utils.logger import start_logger
 from open_webui.socket.main import (
@@ -617,6 +618,8 @@ async def lifespan(app: FastAPI):
     if hasattr(app.state, "redis_task_command_listener"):
         app.state.redis_task_command_listener.cancel()
 
+    await ezfp_client.aclose()
+
 
 app = FastAPI(
     title="Open WebUI",
@@ -0,0 +1,43 @@
+"""add composite index to credit log
+
+Revision ID: b3f1c29a7d41
+Revises: 3af16a1c9fb6
+Create Date: 2026-08-29 11:02:17.304815
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import open_webui.internal.db
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1c29a7d41"
+down_revision: Union[str, None] = "3af16a1c9fb6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # composite index matching the per-user log listing
+    # (WHERE user_id = ? ORDER BY created_at DESC LIMIT n);
+    # on Postgres it also covers the credit column. detail must not be
+    # INCLUDEd: index tuples cannot be TOASTed and large details would
+    # make inserts fail with "index row size exceeds btree maximum"
+    op.create_index(
+        "ix_credit_log_user_id_created_at",
+        "credit_log",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+        postgresql_include=["credit"],
+    )
+    # superseded by the composite index above
+    op.drop_index(op.f("ix_credit_log_user_id"), table_name="credit_log")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_credit_log_user_id"), "credit_log", ["user_id"], unique=False
+    )
+    op.drop_index("ix_credit_log_user_id_created_at", table_name="credit_log")
@@ -0,0 +1,63 @@
+"""add micro credit columns
+
+Revision ID: c8d4e02f5a17
+Revises: b3f1c29a7d41
+Create Date: 2026-08-29 14:26:53.118244
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import open_webui.internal.db
+
+# revision identifiers, used by Alembic.
+revision: str = "c8d4e02f5a17"
+down_revision: Union[str, None] = "b3f1c29a7d41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# must match CREDIT_MICRO_UNITS in open_webui.models.credits
+CREDIT_MICRO_UNITS = 1_000_000
+
+
+def upgrade() -> None:
+    op.add_column(
+        "credit", sa.Column("credit_micro", sa.BigInteger(), nullable=True)
+    )
+    op.add_column(
+        "trade_ticket", sa.Column("amount_micro", sa.BigInteger(), nullable=True)
+    )
+
+    # backfill the exact int64 micro representation from the Numeric columns
+    credit = sa.table(
+        "credit",
+        sa.column("credit", sa.Numeric),
+        sa.column("credit_micro", sa.BigInteger),
+    )
+    op.execute(
+        credit.update().values(
+            credit_micro=sa.cast(
+                sa.func.round(credit.c.credit * CREDIT_MICRO_UNITS), sa.BigInteger
+            )
+        )
+    )
+    trade_ticket = sa.table(
+        "trade_ticket",
+        sa.column("amount", sa.Numeric),
+        sa.column("amount_micro", sa.BigInteger),
+    )
+    op.execute(
+        trade_ticket.update().values(
+            amount_micro=sa.cast(
+                sa.func.round(trade_ticket.c.amount * CREDIT_MICRO_UNITS),
+                sa.BigInteger,
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("trade_ticket", "amount_micro")
+    op.drop_column("credit", "credit_micro")
@@ -0,0 +1,49 @@
+"""use jsonb for credit detail
+
+Revision ID: d5e9b36c7f02
+Revises: c8d4e02f5a17
+Create Date: 2026-08-29 16:48:05.662931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+import open_webui.internal.db
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e9b36c7f02"
+down_revision: Union[str, None] = "c8d4e02f5a17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB only exists on Postgres; other backends keep the generic JSON type
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "credit_log",
+        "detail",
+        type_=postgresql.JSONB(),
+        postgresql_using="detail::jsonb",
+    )
+    op.alter_column(
+        "trade_ticket",
+        "detail",
+        type_=postgresql.JSONB(),
+        postgresql_using="detail::jsonb",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "credit_log", "detail", type_=sa.JSON(), postgresql_using="detail::json"
+    )
+    op.alter_column(
+        "trade_ticket", "detail", type_=sa.JSON(), postgresql_using="detail::json"
+    )
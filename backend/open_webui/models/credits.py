@@ -1,11 +1,24 @@
 import time
-import uuid
+import secrets
+from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional, Tuple
 
+import orjson
 from fastapi import HTTPException
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import JSON, BigInteger, Column, Numeric, String, or_
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Index,
+    Numeric,
+    String,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 
 from open_webui.env import (
     REDIS_URL,
@@ -21,6 +34,15 @@ from open_webui.utils.redis import get_redis_connection, get_sentinels_from_env
 # User Credit DB Schema
 ####################
 
+# exact int64 "micro-credit" representation (6 decimal places); balance
+# mutations run as native integer adds on the _micro columns while the
+# legacy Numeric columns are kept in sync for existing readers
+CREDIT_MICRO_UNITS = 1_000_000
+
+
+def to_micro(amount: Decimal) -> int:
+    return int((Decimal(amount) * CREDIT_MICRO_UNITS).to_integral_value())
+
 
 class Credit(Base):
     __tablename__ = "credit"
@@ -28,6 +50,7 @@ class Credit(Base):
     id = Column(String, primary_key=True)
     user_id = Column(String, unique=True, nullable=False)
     credit = Column(Numeric(precision=24, scale=12))
+    credit_micro = Column(BigInteger, nullable=True)
 
     updated_at = Column(BigInteger)
     created_at = Column(BigInteger)
@@ -37,12 +60,26 @@ class CreditLog(Base):
     __tablename__ = "credit_log"
 
     id = Column(String, primary_key=True)
-    user_id = Column(String, index=True, nullable=False)
+    user_id = Column(String, nullable=False)
     credit = Column(Numeric(precision=24, scale=12))
-    detail = Column(JSON, nullable=True)
+    detail = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
 
     created_at = Column(BigInteger, index=True)
 
+    # matches the per-user log listing (WHERE user_id = ? ORDER BY
+    # created_at DESC LIMIT n) so the DB walks the index in order
+    # instead of sorting; replaces the old single-column user_id index.
+    # detail is deliberately not INCLUDEd: it routinely exceeds the
+    # ~2.7 KB btree tuple cap and would make inserts fail on Postgres
+    __table_args__ = (
+        Index(
+            "ix_credit_log_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["credit"],
+        ),
+    )
+
 
 class TradeTicket(Base):
     __tablename__ = "trade_ticket"
@@ -50,7 +87,8 @@ class TradeTicket(Base):
     id = Column(String, primary_key=True)
     user_id = Column(String, index=True, nullable=False)
     amount = Column(Numeric(precision=24, scale=12))
-    detail = Column(JSON, nullable=True)
+    amount_micro = Column(BigInteger, nullable=True)
+    detail = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
 
     created_at = Column(BigInteger, index=True)
 
@@ -75,16 +113,28 @@ class RedemptionCode(Base):
 
 class CreditModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    id: str = Field(default_factory=lambda: secrets.token_hex(16))
     user_id: str
     credit: Decimal = Field(default_factory=lambda: Decimal("0"))
     updated_at: int = Field(default_factory=lambda: int(time.time()))
     created_at: int = Field(default_factory=lambda: int(time.time()))
 
+    @classmethod
+    def from_row(cls, row: "Credit") -> "CreditModel":
+        # rows are already constrained by the DB schema,
+        # so skip Pydantic validation on the read path
+        return cls.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            credit=row.credit,
+            updated_at=row.updated_at,
+            created_at=row.created_at,
+        )
+
 
 class CreditLogModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    id: str = Field(default_factory=lambda: secrets.token_hex(16))
     user_id: str
     credit: Decimal = Field(default_factory=lambda: Decimal("0"))
     detail: dict = Field(default_factory=lambda: {})
@@ -126,6 +176,19 @@ class CreditLogSimpleModel(CreditLogModel):
     detail: CreditLogSimpleDetail
     username: Optional[str] = Field(default="")
 
+    @classmethod
+    def from_row(cls, row: "CreditLog") -> "CreditLogSimpleModel":
+        # the detail JSON is semi-structured and still needs coercion
+        # (usage prices are stored as floats); the flat columns do not
+        return cls.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            credit=row.credit,
+            detail=CreditLogSimpleDetail.model_validate(row.detail or {}),
+            created_at=row.created_at,
+            username="",
+        )
+
 
 class SetCreditFormDetail(BaseModel):
     api_path: str = Field(default="")
@@ -133,6 +196,16 @@ class SetCreditFormDetail(BaseModel):
     desc: str = Field(default="")
     usage: dict = Field(default_factory=lambda: {})
 
+    def to_log_detail(self) -> dict:
+        # the form was already validated on ingress; direct attribute
+        # access skips a full model_dump pass on every credit write
+        return {
+            "api_path": self.api_path,
+            "api_params": self.api_params,
+            "desc": self.desc,
+            "usage": self.usage,
+        }
+
 
 class AddCreditForm(BaseModel):
     user_id: str
@@ -148,12 +221,22 @@ class SetCreditForm(BaseModel):
 
 class TradeTicketModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
-    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    id: str = Field(default_factory=lambda: secrets.token_hex(16))
     user_id: str
     amount: Decimal = Field(default_factory=lambda: Decimal("0"))
     detail: dict = Field(default_factory=lambda: {})
     created_at: int = Field(default_factory=lambda: int(time.time()))
 
+    @classmethod
+    def from_row(cls, row: "TradeTicket") -> "TradeTicketModel":
+        return cls.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            amount=row.amount,
+            detail=row.detail or {},
+            created_at=row.created_at,
+        )
+
 
 class RedemptionCodeModel(BaseModel):
     model_config = ConfigDict(from_attributes=True, extra="allow")
@@ -166,6 +249,54 @@ class RedemptionCodeModel(BaseModel):
     received_at: Optional[int] = None
 
 
+####################
+# Serialization
+####################
+
+
+def _orjson_default(obj):
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError
+
+
+def _project_log_detail(detail: Optional[dict]) -> dict:
+    # expose only what CreditLogSimpleDetail used to surface: the stored
+    # api_params carries the full model dump (params, access_control,
+    # meta), which must not reach non-admin callers
+    detail = detail or {}
+    model = (detail.get("api_params") or {}).get("model") or {}
+    return {
+        "desc": detail.get("desc", ""),
+        "api_params": {"model": {"id": model.get("id"), "name": model.get("name")}},
+        "usage": detail.get("usage") or {},
+    }
+
+
+def serialize_credit_log_rows(rows) -> bytes:
+    """
+    Serialize raw credit log rows straight to JSON bytes, skipping
+    Pydantic model hydration on the read path while keeping the
+    whitelisted detail projection the response model applied.
+    """
+    return orjson.dumps(
+        [
+            {
+                "id": row.id,
+                "user_id": row.user_id,
+                "credit": row.credit,
+                "detail": _project_log_detail(row.detail),
+                "created_at": row.created_at,
+                "username": "",
+            }
+            for row in rows
+        ],
+        default=_orjson_default,
+    )
+
+
 ####################
 # Tables
 ####################
@@ -176,11 +307,18 @@ class CreditsTable:
         from open_webui.config import CREDIT_DEFAULT_CREDIT
 
         try:
+            now = int(time.time())
             credit_model = CreditModel(
-                user_id=user_id, credit=Decimal(CREDIT_DEFAULT_CREDIT.value)
+                user_id=user_id,
+                credit=Decimal(CREDIT_DEFAULT_CREDIT.value),
+                updated_at=now,
+                created_at=now,
             )
             with get_db() as db:
-                result = Credit(**credit_model.model_dump())
+                result = Credit(
+                    **credit_model.model_dump(),
+                    credit_micro=to_micro(credit_model.credit),
+                )
                 db.add(result)
                 db.commit()
                 db.refresh(result)
@@ -202,52 +340,115 @@ class CreditsTable:
         try:
             with get_db() as db:
                 credit = db.query(Credit).filter(Credit.user_id == user_id).first()
-                return CreditModel.model_validate(credit)
+                return CreditModel.from_row(credit) if credit else None
         except Exception:
             return None
 
     def list_credits_by_user_id(self, user_ids: List[str]) -> List[CreditModel]:
         try:
             with get_db() as db:
-                credits = db.query(Credit).filter(Credit.user_id.in_(user_ids)).all()
-                return [CreditModel.model_validate(credit) for credit in credits]
+                # fetch plain column rows instead of mapped ORM objects;
+                # admin listings can cover many users and the identity-map
+                # bookkeeping per row is pure overhead here
+                stmt = select(
+                    Credit.id,
+                    Credit.user_id,
+                    Credit.credit,
+                    Credit.updated_at,
+                    Credit.created_at,
+                ).where(Credit.user_id.in_(user_ids))
+                return [
+                    CreditModel.model_construct(**row)
+                    for row in db.execute(stmt).yield_per(1000).mappings()
+                ]
         except Exception:
             return []
 
+    def _get_or_create_credit(self, db, user_id: str) -> Credit:
+        # fetch the credit row inside the caller's session, creating it
+        # with the default credit if missing, so credit mutations can run
+        # in a single transaction instead of one session per statement
+        from open_webui.config import CREDIT_DEFAULT_CREDIT
+
+        credit = db.query(Credit).filter(Credit.user_id == user_id).first()
+        if credit is None:
+            now = int(time.time())
+            credit_model = CreditModel(
+                user_id=user_id,
+                credit=Decimal(CREDIT_DEFAULT_CREDIT.value),
+                updated_at=now,
+                created_at=now,
+            )
+            credit = Credit(
+                **credit_model.model_dump(),
+                credit_micro=to_micro(credit_model.credit),
+            )
+            db.add(credit)
+            db.flush()
+        return credit
+
     def set_credit_by_user_id(self, form_data: SetCreditForm) -> CreditModel:
-        credit_model = self.init_credit_by_user_id(user_id=form_data.user_id)
-        log = CreditLogModel(
-            user_id=form_data.user_id,
-            credit=form_data.credit,
-            detail=form_data.detail.model_dump(),
-        )
         with get_db() as db:
+            now = int(time.time())
+            credit = self._get_or_create_credit(db, form_data.user_id)
+            log = CreditLogModel(
+                user_id=form_data.user_id,
+                credit=form_data.credit,
+                detail=form_data.detail.to_log_detail(),
+                created_at=now,
+            )
             db.add(CreditLog(**log.model_dump()))
-            db.query(Credit).filter(Credit.user_id == credit_model.user_id).update(
-                {"credit": form_data.credit, "updated_at": int(time.time())},
+            db.query(Credit).filter(Credit.user_id == form_data.user_id).update(
+                {
+                    "credit": form_data.credit,
+                    "credit_micro": to_micro(form_data.credit),
+                    "updated_at": now,
+                },
                 synchronize_session=False,
             )
             db.commit()
-        return self.get_credit_by_user_id(user_id=form_data.user_id)
+            return CreditModel(
+                id=credit.id,
+                user_id=form_data.user_id,
+                credit=form_data.credit,
+                updated_at=now,
+                created_at=credit.created_at,
+            )
 
-    def add_credit_by_user_id(self, form_data: AddCreditForm) -> Optional[CreditModel]:
-        credit_model = self.init_credit_by_user_id(user_id=form_data.user_id)
+    def add_credit_in_session(self, db, form_data: AddCreditForm) -> CreditModel:
+        # apply a credit change inside the caller's session without
+        # committing, so callers can settle related writes atomically
+        now = int(time.time())
+        credit = self._get_or_create_credit(db, form_data.user_id)
+        new_credit = credit.credit + form_data.amount
         log = CreditLogModel(
             user_id=form_data.user_id,
-            credit=credit_model.credit + form_data.amount,
-            detail=form_data.detail.model_dump(),
+            credit=new_credit,
+            detail=form_data.detail.to_log_detail(),
+            created_at=now,
         )
+        db.add(CreditLog(**log.model_dump()))
+        db.query(Credit).filter(Credit.user_id == form_data.user_id).update(
+            {
+                "credit": Credit.credit + form_data.amount,
+                "credit_micro": Credit.credit_micro + to_micro(form_data.amount),
+                "updated_at": now,
+            },
+            synchronize_session=False,
+        )
+        return CreditModel(
+            id=credit.id,
+            user_id=form_data.user_id,
+            credit=new_credit,
+            updated_at=now,
+            created_at=credit.created_at,
+        )
+
+    def add_credit_by_user_id(self, form_data: AddCreditForm) -> Optional[CreditModel]:
         with get_db() as db:
-            db.add(CreditLog(**log.model_dump()))
-            db.query(Credit).filter(Credit.user_id == form_data.user_id).update(
-                {
-                    "credit": Credit.credit + form_data.amount,
-                    "updated_at": int(time.time()),
-                },
-                synchronize_session=False,
-            )
+            credit_model = self.add_credit_in_session(db, form_data)
             db.commit()
-        return self.get_credit_by_user_id(form_data.user_id)
+            return credit_model
 
 
 Credits = CreditsTable()
@@ -265,7 +466,12 @@ class TradeTicketTable:
                 detail=detail,
             )
             with get_db() as db:
-                db.add(TradeTicket(**ticket.model_dump()))
+                db.add(
+                    TradeTicket(
+                        **ticket.model_dump(),
+                        amount_micro=to_micro(ticket.amount),
+                    )
+                )
                 db.commit()
             return ticket
         except Exception as err:
@@ -275,7 +481,7 @@ class TradeTicketTable:
         try:
             with get_db() as db:
                 ticket = db.query(TradeTicket).filter(TradeTicket.id == id).first()
-                return TradeTicketModel.model_validate(ticket)
+                return TradeTicketModel.from_row(ticket) if ticket else None
         except Exception:
             return None
 
@@ -290,7 +496,7 @@ class TradeTicketTable:
                     .filter(TradeTicket.created_at < end_time)
                     .order_by(TradeTicket.created_at.asc())
                 )
-                return [TradeTicketModel.model_validate(log) for log in logs]
+                return [TradeTicketModel.from_row(log) for log in logs]
         except Exception:
             return []
 
@@ -299,18 +505,21 @@ class TradeTicketTable:
 
         try:
             with get_db() as db:
-                db.query(TradeTicket).filter(TradeTicket.id == id).update(
-                    {"detail": detail}
-                )
-                db.commit()
-                ticket = self.get_ticket_by_id(id)
-                Credits.add_credit_by_user_id(
+                # settle the callback in one transaction: the ticket row
+                # already carries user_id/amount, so no re-query is needed
+                ticket = db.query(TradeTicket).filter(TradeTicket.id == id).first()
+                if ticket is None:
+                    return None
+                ticket.detail = detail
+                Credits.add_credit_in_session(
+                    db,
                     AddCreditForm(
                         user_id=ticket.user_id,
                         amount=ticket.amount * Decimal(CREDIT_EXCHANGE_RATIO.value),
                         detail=SetCreditFormDetail(desc="payment success"),
-                    )
+                    ),
                 )
+                db.commit()
                 return None
         except Exception:
             return None
@@ -342,7 +551,29 @@ class CreditLogTable:
             if limit:
                 query = query.limit(limit)
             all_logs = query.all()
-            return [CreditLogSimpleModel.model_validate(log) for log in all_logs]
+            return [CreditLogSimpleModel.from_row(log) for log in all_logs]
+
+    def get_credit_log_rows_by_page(
+        self,
+        user_ids: list[str] = None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list:
+        with get_db() as db:
+            stmt = select(
+                CreditLog.id,
+                CreditLog.user_id,
+                CreditLog.credit,
+                CreditLog.detail,
+                CreditLog.created_at,
+            ).order_by(CreditLog.created_at.desc())
+            if user_ids:
+                stmt = stmt.where(CreditLog.user_id.in_(user_ids))
+            if offset:
+                stmt = stmt.offset(offset)
+            if limit:
+                stmt = stmt.limit(limit)
+            return db.execute(stmt).all()
 
     def get_log_by_time(
         self, start_time: int, end_time: int
@@ -355,7 +586,7 @@ class CreditLogTable:
                     .filter(CreditLog.created_at < end_time)
                     .order_by(CreditLog.created_at.asc())
                 )
-                return [CreditLogSimpleModel.model_validate(log) for log in logs]
+                return [CreditLogSimpleModel.from_row(log) for log in logs]
         except Exception:
             return []
 
@@ -480,7 +711,7 @@ class RedemptionCodeTable:
                 db.query(RedemptionCode).filter(RedemptionCode.code == code).update(
                     {
                         "user_id": user_id,
-                        "received_at": int(time.time()),
+                        "received_at": now,
                     }
                 )
                 db.commit()
@@ -53,6 +53,8 @@ from open_webui.utils.auth import (
     get_current_user,
     get_password_hash,
     get_http_authorization_cred,
+    invalidate_user_cache,
+    invalidate_verify_password_cache,
     send_verify_email,
     verify_email_by_code,
 )
@@ -161,6 +163,7 @@ async def update_profile(
             form_data.model_dump(),
         )
         if user:
+            invalidate_user_cache(user.id)
             return user
         else:
             raise HTTPException(400, detail=ERROR_MESSAGES.DEFAULT())
@@ -184,7 +187,10 @@ async def update_password(
 
         if user:
             hashed = get_password_hash(form_data.new_password)
-            return Auths.update_user_password_by_id(user.id, hashed)
+            result = Auths.update_user_password_by_id(user.id, hashed)
+            # drop cached verifications against the old hash
+            invalidate_verify_password_cache()
+            return result
         else:
             raise HTTPException(400, detail=ERROR_MESSAGES.INVALID_PASSWORD)
     else:
@@ -1100,6 +1106,8 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
     success = Users.update_user_api_key_by_id(user.id, api_key)
 
     if success:
+        # drop any cache entry keyed by the previous api key
+        invalidate_user_cache(user.id)
         return {
             "api_key": api_key,
         }
@@ -1111,6 +1119,9 @@ async def generate_api_key(request: Request, user=Depends(get_current_user)):
 @router.delete("/api_key", response_model=bool)
 async def delete_api_key(user=Depends(get_current_user)):
     success = Users.update_user_api_key_by_id(user.id, None)
+    if success:
+        # otherwise the revoked key keeps authenticating until the TTL expires
+        invalidate_user_cache(user.id)
     return success
 
 
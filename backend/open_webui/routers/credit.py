@@ -16,10 +16,10 @@ from open_webui.env import SRC_LOG_LEVELS
 from open_webui.models.credits import (
     TradeTicketModel,
     TradeTickets,
-    CreditLogSimpleModel,
     CreditLogs,
     RedemptionCodes,
     RedemptionCodeModel,
+    serialize_credit_log_rows,
 )
 from open_webui.models.models import Models, ModelPriceForm
 from open_webui.models.users import UserModel, Users
@@ -43,18 +43,23 @@ async def get_config(request: Request):
     }
 
 
-@router.get("/logs", response_model=list[CreditLogSimpleModel])
+@router.get("/logs")
 async def list_credit_logs(
     page: Optional[int] = None, user: UserModel = Depends(get_verified_user)
-) -> TradeTicketModel:
+) -> Response:
     if page:
         limit = PAGE_ITEM_COUNT
         offset = (page - 1) * limit
-        return CreditLogs.get_credit_log_by_page(
-            user_ids=[user.id], offset=offset, limit=limit
-        )
     else:
-        return CreditLogs.get_credit_log_by_page(user_ids=[user.id], offset=0, limit=10)
+        offset, limit = 0, 10
+    # serialize raw rows directly; re-validating rows through Pydantic
+    # and jsonable_encoder doubles the cost of this hot list endpoint
+    rows = CreditLogs.get_credit_log_rows_by_page(
+        user_ids=[user.id], offset=offset, limit=limit
+    )
+    return Response(
+        content=serialize_credit_log_rows(rows), media_type="application/json"
+    )
 
 
 class DeleteLogsForm(BaseModel):
@@ -39,7 +39,13 @@ from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import SRC_LOG_LEVELS, STATIC_DIR
 
 
-from open_webui.utils.auth import get_admin_user, get_password_hash, get_verified_user
+from open_webui.utils.auth import (
+    get_admin_user,
+    get_password_hash,
+    get_verified_user,
+    invalidate_user_cache,
+    invalidate_verify_password_cache,
+)
 from open_webui.utils.access_control import get_permissions, has_permission
 
 
@@ -266,6 +272,7 @@ async def update_user_settings_by_session_user(
 
     user = Users.update_user_settings_by_id(user.id, updated_user_settings)
     if user:
+        invalidate_user_cache(user.id)
         return user.settings
     else:
         raise HTTPException(
@@ -307,6 +314,7 @@ async def update_user_info_by_session_user(
 
         user = Users.update_user_by_id(user.id, {"info": {**user.info, **form_data}})
         if user:
+            invalidate_user_cache(user.id)
             return user.info
         else:
             raise HTTPException(
@@ -465,6 +473,8 @@ async def update_user_by_id(
             hashed = get_password_hash(form_data.password)
             log.debug(f"hashed: {hashed}")
             Auths.update_user_password_by_id(user_id, hashed)
+            # drop cached verifications against the old hash
+            invalidate_verify_password_cache()
 
         Auths.update_email_by_id(user_id, form_data.email.lower())
         updated_user = Users.update_user_by_id(
@@ -492,6 +502,7 @@ async def update_user_by_id(
             setattr(updated_user, "credit", "%.4f" % credit.credit)
 
         if updated_user:
+            invalidate_user_cache(user_id)
             return updated_user
 
         raise HTTPException(
@@ -575,6 +586,7 @@ async def delete_user_by_id(user_id: str, user=Depends(get_admin_user)):
         result = Auths.delete_auth_by_id(user_id)
 
         if result:
+            invalidate_user_cache(user_id)
             return True
 
         raise HTTPException(
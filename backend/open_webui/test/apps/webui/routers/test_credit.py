@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from test.util.abstract_integration_test import AbstractPostgresTest
+from test.util.mock_user import mock_webui_user
+
+
+class TestCredit(AbstractPostgresTest):
+    BASE_PATH = "/api/v1/credit"
+
+    def setup_class(cls):
+        super().setup_class()
+        from open_webui.models.credits import (
+            AddCreditForm,
+            Credits,
+            SetCreditFormDetail,
+        )
+
+        cls.credits = Credits
+        cls.add_credit_form = AddCreditForm
+        cls.detail_form = SetCreditFormDetail
+
+    def test_list_credit_logs_whitelists_detail(self):
+        # the stored detail carries the full model dump, including fields
+        # that must never be returned to a non-admin caller
+        self.credits.add_credit_by_user_id(
+            self.add_credit_form(
+                user_id="2",
+                amount=Decimal("-1.5"),
+                detail=self.detail_form(
+                    api_path="/api/chat/completions",
+                    desc="chat completion",
+                    api_params={
+                        "model": {
+                            "id": "test-model",
+                            "name": "Test Model",
+                            "params": {"system": "secret system prompt"},
+                            "access_control": {"read": {"user_ids": ["1"]}},
+                            "meta": {
+                                "profile_image_url": "data:image/png;base64,AAAA"
+                            },
+                        }
+                    },
+                    usage={"total_price": 1.5, "total_tokens": 10},
+                ),
+            )
+        )
+
+        with mock_webui_user(id="2"):
+            response = self.fast_api_client.get(self.create_url("/logs"))
+        assert response.status_code == 200
+        logs = response.json()
+        assert len(logs) == 1
+
+        log = logs[0]
+        assert log["user_id"] == "2"
+        detail = log["detail"]
+        assert detail["desc"] == "chat completion"
+        assert detail["usage"]["total_tokens"] == 10
+
+        # only the whitelisted model projection may be exposed
+        assert detail["api_params"]["model"] == {
+            "id": "test-model",
+            "name": "Test Model",
+        }
+        assert set(detail.keys()) == {"desc", "api_params", "usage"}
+        assert "access_control" not in response.text
+        assert "secret system prompt" not in response.text
@@ -1,5 +1,9 @@
+import functools
 import logging
+import secrets
 import shutil
+import threading
+import time
 import uuid
 import jwt
 import base64
@@ -15,9 +19,7 @@ from cryptography.hazmat.primitives import serialization
 import json
 
 
-from datetime import datetime, timedelta
-import pytz
-from pytz import UTC
+from datetime import timedelta
 from typing import Optional, Union, List, Dict
 
 from opentelemetry import trace
@@ -174,13 +176,57 @@ def get_license_data(app, key):
 
 
 bearer_security = HTTPBearer(auto_error=False)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# pin the bcrypt variant and work factor so hashing cost is deterministic
+# across deployments instead of whatever passlib's defaults resolve to
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+    bcrypt__ident="2b",
+)
+
+try:
+    if pwd_context.handler("bcrypt").get_backend() == "builtin":
+        log.warning(
+            "passlib is using its pure-Python bcrypt fallback; "
+            "install the 'bcrypt' package for the C backend"
+        )
+except Exception:
+    pass
+
+# bcrypt verification costs tens of milliseconds by design; repeat
+# verifies of the same (password, hash) pair within a short window are
+# served from a bounded cache keyed on an HMAC of the password so the
+# plaintext itself is never held
+_VERIFY_CACHE_MAX_SIZE = 4096
+_verify_cache = {}
+_verify_cache_lock = threading.Lock()
+
+
+def invalidate_verify_password_cache():
+    with _verify_cache_lock:
+        _verify_cache.clear()
 
 
 def verify_password(plain_password, hashed_password):
-    return (
-        pwd_context.verify(plain_password, hashed_password) if hashed_password else None
+    if not hashed_password:
+        return None
+    cache_key = (
+        hmac.new(
+            SESSION_SECRET.encode(), plain_password.encode(), hashlib.sha256
+        ).digest(),
+        hashed_password,
     )
+    with _verify_cache_lock:
+        cached = _verify_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    result = pwd_context.verify(plain_password, hashed_password)
+    with _verify_cache_lock:
+        if len(_verify_cache) >= _VERIFY_CACHE_MAX_SIZE:
+            _verify_cache.clear()
+        _verify_cache[cache_key] = result
+    return result
 
 
 def get_password_hash(password):
@@ -191,19 +237,41 @@ def create_token(data: dict, expires_delta: Union[timedelta, None] = None) -> st
     payload = data.copy()
 
     if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-        payload.update({"exp": expire})
+        # PyJWT accepts an int exp directly; skip the aware-datetime
+        # construction and tz arithmetic per minted token
+        payload["exp"] = int(time.time()) + int(expires_delta.total_seconds())
 
     encoded_jwt = jwt.encode(payload, SESSION_SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+# a logged-in user presents the same token on every request; memoize the
+# decoded payload so repeat requests skip base64/JSON parsing and the
+# HMAC pass, while still honoring the token's own expiry
+_TOKEN_CACHE_MAX_SIZE = 50_000
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Optional[dict]:
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+    if entry is not None:
+        exp, decoded = entry
+        if exp is None or exp > time.time():
+            return decoded
+        with _token_cache_lock:
+            _token_cache.pop(token, None)
+        return None
     try:
         decoded = jwt.decode(token, SESSION_SECRET, algorithms=[ALGORITHM])
-        return decoded
     except Exception:
         return None
+    with _token_cache_lock:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.clear()
+        _token_cache[token] = (decoded.get("exp"), decoded)
+    return decoded
 
 
 def extract_token_from_auth_header(auth_header: str):
@@ -211,8 +279,9 @@ def extract_token_from_auth_header(auth_header: str):
 
 
 def create_api_key():
-    key = str(uuid.uuid4()).replace("-", "")
-    return f"sk-{key}"
+    # same 32-hex-char shape as before, straight from urandom without
+    # constructing a UUID object just to throw it away
+    return f"sk-{secrets.token_hex(16)}"
 
 
 def get_http_authorization_cred(auth_header: Optional[str]):
@@ -225,6 +294,53 @@ def get_http_authorization_cred(auth_header: Optional[str]):
         return None
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_api_key_allowed_endpoints(raw: str):
+    # keyed on the raw config string, so a config change
+    # simply compiles a new entry
+    allowed_paths = tuple(path.strip() for path in raw.split(","))
+    return frozenset(allowed_paths), tuple(path + "/" for path in allowed_paths)
+
+
+# every authenticated request used to pay a DB round-trip to re-load the
+# user row; lookups are cached for a short window, keyed by user id (JWT
+# auth) or by the api key string (api-key auth)
+_USER_CACHE_TTL = 30
+_USER_CACHE_MAX_SIZE = 10_000
+_user_cache = {}
+_user_cache_lock = threading.RLock()
+
+
+def _get_cached_user(key: str):
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < time.time():
+            _user_cache.pop(key, None)
+            return None
+        return user
+
+
+def _set_cached_user(key: str, user) -> None:
+    with _user_cache_lock:
+        if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+            _user_cache.clear()
+        _user_cache[key] = (time.time() + _USER_CACHE_TTL, user)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+        # api-key entries are keyed by the key string; drop those too
+        stale_keys = [
+            key for key, (_, user) in _user_cache.items() if user.id == user_id
+        ]
+        for key in stale_keys:
+            _user_cache.pop(key, None)
+
+
 def get_current_user(
     request: Request,
     response: Response,
@@ -250,19 +366,13 @@ def get_current_user(
             )
 
         if request.app.state.config.ENABLE_API_KEY_ENDPOINT_RESTRICTIONS:
-            allowed_paths = [
-                path.strip()
-                for path in str(
-                    request.app.state.config.API_KEY_ALLOWED_ENDPOINTS
-                ).split(",")
-            ]
+            allowed_paths, allowed_prefixes = _compile_api_key_allowed_endpoints(
+                str(request.app.state.config.API_KEY_ALLOWED_ENDPOINTS)
+            )
 
             # Check if the request path matches any allowed endpoint.
-            if not any(
-                request.url.path == allowed
-                or request.url.path.startswith(allowed + "/")
-                for allowed in allowed_paths
-            ):
+            path = request.url.path
+            if path not in allowed_paths and not path.startswith(allowed_prefixes):
                 raise HTTPException(
                     status.HTTP_403_FORBIDDEN, detail=ERROR_MESSAGES.API_KEY_NOT_ALLOWED
                 )
@@ -289,7 +399,11 @@ def get_current_user(
         )
 
     if data is not None and "id" in data:
-        user = Users.get_user_by_id(data["id"])
+        user = _get_cached_user(data["id"])
+        if user is None:
+            user = Users.get_user_by_id(data["id"])
+            if user is not None:
+                _set_cached_user(data["id"], user)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -332,7 +446,11 @@ def get_current_user(
 
 
 def get_current_user_by_api_key(api_key: str):
-    user = Users.get_user_by_api_key(api_key)
+    user = _get_cached_user(api_key)
+    if user is None:
+        user = Users.get_user_by_api_key(api_key)
+        if user is not None:
+            _set_cached_user(api_key, user)
 
     if user is None:
         raise HTTPException(
@@ -1,5 +1,6 @@
-import copy
 import hashlib
+import hmac
+import re
 
 import httpx
 
@@ -12,6 +13,40 @@ from open_webui.config import (
     EZFP_AMOUNT_CONTROL,
 )
 
+# device markers matched in one pass over the UA; rank keeps the
+# in-app browsers ahead of the generic mobile markers, since e.g.
+# the WeChat UA also contains "android"/"iphone"
+_UA_RE = re.compile(r"micromessenger|qq|alipay|android|iphone", re.I)
+_UA_DEVICES = {
+    "micromessenger": ("wechat", 0),
+    "qq": ("qq", 1),
+    "alipay": ("alipay", 2),
+    "android": ("mobile", 3),
+    "iphone": ("mobile", 3),
+}
+
+# keys signed by create_trade, presorted so signing
+# needs no per-call filtering and lexical sort
+_SIGN_KEYS = (
+    "clientip",
+    "device",
+    "money",
+    "name",
+    "notify_url",
+    "out_trade_no",
+    "pid",
+    "return_url",
+    "type",
+)
+
+# shared client so repeated trade submissions reuse pooled connections
+# instead of paying a fresh TCP+TLS handshake per payment
+_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(10.0),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
 
 class EZFPClient:
     """
@@ -19,38 +54,46 @@ class EZFPClient:
     """
 
     def get_device_from_ua(self, ua: str) -> str:
-        ua = ua.lower()
-        if ua.find("micromessenger") != -1:
-            return "wechat"
-        if ua.find("qq") != -1:
-            return "qq"
-        if ua.find("alipay") != -1:
-            return "alipay"
-        if ua.find("android") != -1 or ua.find("iphone") != -1:
-            return "mobile"
-        return "pc"
+        device, best_rank = "pc", None
+        for match in _UA_RE.finditer(ua):
+            candidate, rank = _UA_DEVICES[match.group(0).lower()]
+            if best_rank is None or rank < best_rank:
+                device, best_rank = candidate, rank
+                if rank == 0:
+                    break
+        return device
 
     def sign(self, payload: dict) -> dict:
-        params = [
-            f"{k}={v}"
-            for k, v in payload.items()
-            if v and k not in ["sign", "sign_type"]
-        ]
-        params.sort()
-        plain_text = "&".join(params) + EZFP_KEY.value
-        sign = hashlib.md5(plain_text.encode()).hexdigest()
-        payload["sign"] = sign
+        # feed the digest incrementally instead of building the joined
+        # plain-text string; the signature is a protocol checksum, so the
+        # non-FIPS fast path is fine
+        h = hashlib.md5(usedforsecurity=False)
+        sep = ""
+        for k in _SIGN_KEYS:
+            v = payload.get(k)
+            if v:
+                h.update(f"{sep}{k}={v}".encode())
+                sep = "&"
+        h.update(EZFP_KEY.value.encode())
+        payload["sign"] = h.hexdigest()
         payload["sign_type"] = "MD5"
         return payload
 
     def verify(self, payload: dict) -> bool:
-        if payload["pid"] != EZFP_PID.value:
+        if payload.get("pid") != EZFP_PID.value or payload.get("sign_type") != "MD5":
             return False
-        payload2 = self.sign(copy.deepcopy(payload))
-        return (
-            payload["sign"] == payload2["sign"]
-            and payload["sign_type"] == payload2["sign_type"]
-        )
+        # callbacks carry gateway-added keys (trade_no, trade_status, ...),
+        # so the signature is recomputed over the payload's own keys
+        parts = [
+            f"{k}={v}"
+            for k, v in payload.items()
+            if v and k not in ("sign", "sign_type")
+        ]
+        parts.sort()
+        expected = hashlib.md5(
+            ("&".join(parts) + EZFP_KEY.value).encode(), usedforsecurity=False
+        ).hexdigest()
+        return hmac.compare_digest(expected, payload.get("sign", ""))
 
     def check_amount(self, amount: float) -> bool:
         if not EZFP_AMOUNT_CONTROL.value:
@@ -88,16 +131,16 @@ class EZFPClient:
             "device": self.get_device_from_ua(ua=ua),
         }
         payload = self.sign(payload)
-        client = httpx.AsyncClient()
         try:
-            resp = await client.post(
+            resp = await _http_client.post(
                 url=f"{EZFP_ENDPOINT.value.rstrip('/')}/mapi.php", data=payload
             )
             return resp.json()
         except Exception as err:
             return {"code": -1, "msg": str(err)}
-        finally:
-            await client.aclose()
+
+    async def aclose(self) -> None:
+        await _http_client.aclose()
 
 
 ezfp_client = EZFPClient()